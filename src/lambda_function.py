@@ -1,15 +1,25 @@
 from base64 import b64decode
-from datetime import datetime
-from html import escape
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from email.message import EmailMessage
+from email.policy import SMTP
+from functools import lru_cache
+from html import escape, unescape
 from logging import DEBUG, ERROR, INFO, WARNING, getLogger
 from os import getenv
-from re import DOTALL, MULTILINE, Match, Pattern, compile, search
+from quopri import decodestring
+from re import DOTALL, IGNORECASE, MULTILINE, Match, Pattern, compile
+from re import escape as regex_escape
+from string import Formatter
 from typing import Any, Callable, Dict, List, Optional, Tuple
 from urllib.parse import quote
 
 from boto3 import client
+from botocore.config import Config
 
-logger = getLogger()
+# Module logger; records propagate to the handler Lambda installs on the root
+# logger without changing the level of boto3/botocore loggers
+logger = getLogger(__name__)
 
 # Logging configuration constants
 LOG_LEVELS = {
@@ -20,30 +30,53 @@ LOG_LEVELS = {
 }
 DEFAULT_LOG_LEVEL = "INFO"
 
-# Set log level from environment variable, default to DEBUG for development
-log_level = getenv("LOG_LEVEL", "DEBUG").upper()
+# Set log level from environment variable; set LOG_LEVEL=DEBUG for development
+log_level = getenv("LOG_LEVEL", DEFAULT_LOG_LEVEL).upper()
 logger.setLevel(LOG_LEVELS.get(log_level, LOG_LEVELS[DEFAULT_LOG_LEVEL]))
 
-# Initialize clients at module level for connection reuse
+# Initialize clients at module level for connection reuse; like the compiled
+# regexes below, they are built once during Lambda init, not per invocation.
+# Keepalive holds pooled TLS connections open between warm invocations.
+CLIENT_CONFIG = Config(
+    tcp_keepalive=True,
+    retries={"mode": "standard", "max_attempts": 3},
+)
 # amazonq-ignore-next-line
-s3 = client("s3")
-ses = client("ses")
+s3 = client("s3", config=CLIENT_CONFIG)
+ses = client("ses", config=CLIENT_CONFIG)
+
+# Line break bytes stripped from base64 bodies in one bytes.translate pass
+LINE_BREAK_BYTES = b"\r\n"
+# Translation table stripping dashes and spaces from phone numbers in one pass
+PHONE_SEPARATORS_TABLE = str.maketrans("", "", "- ")
+# Translation table rendering dd/mm/yyyy dates as dd.mm.yyyy for WhatsApp
+DATE_SEPARATORS_TABLE = str.maketrans("/", ".")
+# Translation table stripping dashes when comparing attendee phone numbers
+PHONE_DASHES_TABLE = str.maketrans("", "", "-")
 
 MAX_LOG_MESSAGE_LENGTH = 500
 EMAIL_PREVIEW_LENGTH = 500
 HTML_PREVIEW_LENGTH = 200
 DECODED_HTML_PREVIEW_LENGTH = 300
 
+# S3 DeleteObjects limit per request
+MAX_DELETE_BATCH_SIZE = 1000
+
+# Emails larger than this are fetched as parallel byte-range GETs, since a
+# single S3 stream caps per-connection throughput
+RANGED_GET_THRESHOLD = 2 * 1024 * 1024
+RANGED_GET_PARTS = 4
+
 # Business logic constants
 MIN_MEETING_FIELDS = 3  # from + at least 2 meeting fields (date/time, client, etc.)
 
 # Email client forwarding markers
-FORWARDING_MARKERS = [
+CLIENT_FORWARDING_MARKERS = [
     "---------- Forwarded message ---------",  # Gmail
     "Begin forwarded message:",  # Mac Mail
     "-----Original Message-----",  # Outlook
-    "From:",  # Sometimes no explicit marker
 ]
+FALLBACK_FORWARDING_MARKER = "From:"  # Sometimes no explicit marker
 
 # Hebrew month names to numbers mapping
 HEBREW_MONTHS: Dict[str, str] = {
@@ -63,9 +96,17 @@ HEBREW_MONTHS: Dict[str, str] = {
 
 # Supported email domains for meeting automation
 SUPPORTED_DOMAINS: List[str] = ["yoman.co.il", "tagatime.com"]
+SUPPORTED_DOMAIN_REGEX: Pattern[bytes] = compile(
+    b"|".join(regex_escape(domain.encode("ascii")) for domain in SUPPORTED_DOMAINS)
+)
+
+# All client markers are located in a single scan of the content
+CLIENT_FORWARDING_MARKER_REGEX: Pattern[str] = compile(
+    "|".join(regex_escape(marker) for marker in CLIENT_FORWARDING_MARKERS)
+)
 
 # Hebrew day names for weekday conversion
-HEBREW_DAYS: List[str] = [
+HEBREW_DAYS: Tuple[str, ...] = (
     "יום שני",
     "יום שלישי",
     "יום רביעי",
@@ -73,7 +114,7 @@ HEBREW_DAYS: List[str] = [
     "יום שישי",
     "שבת",
     "יום ראשון",
-]
+)
 
 # Email source address for notifications (configurable via environment)
 EMAIL_SOURCE = getenv("EMAIL_SOURCE", "receive@receive.hechven.online")
@@ -107,6 +148,33 @@ WHATSAPP_MESSAGE_TEMPLATE_SINGLE = """שלום {client},
 {consultant_name}
 יועץ הכוון מטעם פעמונים"""
 
+# WhatsApp templates split into (literal, field) segments with the literal text
+# percent-encoded once at import; quote() encodes byte by byte, so per message
+# only the substituted field values still need quoting
+QUOTED_WHATSAPP_TEMPLATES: Dict[str, List[Tuple[str, Optional[str]]]] = {
+    template: [
+        (quote(literal), field) for literal, field, _, _ in Formatter().parse(template)
+    ]
+    for template in (WHATSAPP_MESSAGE_TEMPLATE, WHATSAPP_MESSAGE_TEMPLATE_SINGLE)
+}
+
+# Plain-text email template
+TEXT_EMAIL_TEMPLATE = """שלום,
+
+קישורים שימושיים:
+{whatsapp_section}
+📅 הוסף ליומן: {calendar_link}
+
+אישור פגישה:
+📅 תאריך: {date}
+🕐 שעה: {time}
+{attendee_info}
+
+בהצלחה!"""
+
+# Meeting fields rendered into the notification email bodies
+EMAIL_DETAIL_FIELDS: Tuple[str, ...] = ("date", "time", "client", "phone", "email")
+
 # HTML email template
 HTML_EMAIL_TEMPLATE = """<html><body style="font-family: Arial, sans-serif; direction: rtl;">
 <p>שלום,</p>
@@ -126,45 +194,74 @@ HTML_EMAIL_TEMPLATE = """<html><body style="font-family: Arial, sans-serif; dire
 </body></html>"""
 
 # Regex patterns for extracting meeting details from forwarded content
-DATE_REGEX: Pattern[str] = compile(r"(\d{1,2}) ([^\s]+) (\d{4}) בשעה (\d{1,2}:\d{2})")
-CLIENT_REGEX: Pattern[str] = compile(r"פרטי קשר: ([^\n\r]+)")
+# Free-text fields are capped at MAX_FIELD_LENGTH so a runaway line in noisy HTML
+# cannot make a single match walk the rest of the body
+MAX_FIELD_LENGTH = 200
+DATE_REGEX: Pattern[str] = compile(r"(\d{1,2}) (\S+) (\d{4}) בשעה (\d{1,2}:\d{2})")
+CLIENT_REGEX: Pattern[str] = compile(rf"פרטי קשר: ([^\n\r]{{1,{MAX_FIELD_LENGTH}}})")
 PHONE_REGEX: Pattern[str] = compile(r"נייד: ([0-9]+)")
-EMAIL_REGEX: Pattern[str] = compile(r'דוא"ל: ([^\n\r]+)')
-
-# Compiled regex patterns for HTML content parsing
-BASE64_HTML_REGEX: Pattern[str] = compile(
-    r"Content-Type: text/html[^\r\n]*\r?\nContent-Transfer-Encoding: base64\r?\n\r?\n([^-]+)",
+EMAIL_REGEX: Pattern[str] = compile(rf'דוא"ל: ([^\n\r]{{1,{MAX_FIELD_LENGTH}}})')
+
+# Compiled regex patterns for raw MIME parsing. The raw email stays as bytes
+# (MIME structure and transfer encodings are ASCII); only extracted parts are
+# decoded to str. Every capture is a single negated character class ending the
+# pattern, so matching is linear in the part length; decode_html_content also
+# starts both searches at the first HTML part.
+HTML_PART_HEADER = b"Content-Type: text/html"
+BASE64_ENCODING_HEADER = b"Content-Transfer-Encoding: base64"
+BASE64_HTML_REGEX: Pattern[bytes] = compile(
+    HTML_PART_HEADER
+    + rb"[^\r\n]*\r?\n"
+    + BASE64_ENCODING_HEADER
+    + rb"\r?\n\r?\n([^-]+)",
     DOTALL,
 )
-QUOTED_HTML_REGEX: Pattern[str] = compile(
-    r"Content-Type: text/html[^\r\n]*\r?\n[^\r\n]*\r?\n\r?\n([^\r\n-]+)",
+QUOTED_HTML_REGEX: Pattern[bytes] = compile(
+    HTML_PART_HEADER + rb"[^\r\n]*\r?\n[^\r\n]*\r?\n\r?\n([^\r\n-]+)",
     DOTALL | MULTILINE,
 )
+BASE64_CONTENT_REGEX: Pattern[bytes] = compile(
+    BASE64_ENCODING_HEADER + rb"\r?\n\r?\n([^-]+)", DOTALL
+)
+
+# Compiled regex patterns for email headers and additional attendee lines
+FROM_HEADER_REGEX: Pattern[bytes] = compile(rb"^From:\s*([^\r\n]+)", MULTILINE)
+ANGLE_ADDRESS_REGEX: Pattern[str] = compile(r"<([^>]*)>")
+# Support both Israeli 05x and international +972-5x formats
+ATTENDEE_PHONE_REGEX: Pattern[str] = compile(r"(05[0-9]|\+972-5[0-9])-?[0-9]{7}")
+ATTENDEE_EMAIL_REGEX: Pattern[str] = compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+
+# Compiled regex patterns for HTML cleanup
+BR_TAG_REGEX: Pattern[str] = compile(r"<br\s*/?>", IGNORECASE)
+HTML_TAG_REGEX: Pattern[str] = compile(r"<[^>]+>")
+MULTIPLE_NEWLINES_REGEX: Pattern[str] = compile(r"\n\s*\n")
+HORIZONTAL_WHITESPACE_REGEX: Pattern[str] = compile(r"[ \t]+")
+
+# Translation table deleting C0/C1 control characters (U+0000-001F, U+007F-009F)
+CONTROL_CHARS_TABLE: Dict[int, None] = dict.fromkeys(
+    [*range(0x00, 0x20), *range(0x7F, 0xA0)]
+)
 
 
 def clean_html_tags(text: str) -> str:
     """Remove HTML tags from text while preserving content and spacing."""
     if not text:
         return ""
-    # First decode HTML entities
-    text = (
-        text.replace("&quot;", '"')
-        .replace("&lt;", "<")
-        .replace("&gt;", ">")
-        .replace("&amp;", "&")
-    )
+    # First decode HTML entities in a single pass (skipped for plain text)
+    if "&" in text:
+        text = unescape(text)
 
-    # Remove HTML tags but preserve line breaks and spacing
-    import re
-
-    # Replace <br> and </br> with newlines
-    text = re.sub(r"<br\s*/?>", "\n", text, flags=re.IGNORECASE)
-    # Remove other HTML tags
-    text = re.sub(r"<[^>]+>", "", text)
+    # Remove HTML tags but preserve line breaks and spacing (skipped for plain text)
+    if "<" in text:
+        # Replace <br> and </br> with newlines
+        text = BR_TAG_REGEX.sub("\n", text)
+        # Remove other HTML tags
+        text = HTML_TAG_REGEX.sub("", text)
 
     # Clean up extra whitespace but preserve intentional spacing
-    text = re.sub(r"\n\s*\n", "\n\n", text)  # Multiple newlines to double newlines
-    text = re.sub(r"[ \t]+", " ", text)  # Multiple spaces/tabs to single space
+    # Multiple newlines to double newlines, multiple spaces/tabs to single space
+    text = MULTIPLE_NEWLINES_REGEX.sub("\n\n", text)
+    text = HORIZONTAL_WHITESPACE_REGEX.sub(" ", text)
     text = text.strip()
 
     return text
@@ -175,10 +272,8 @@ def sanitize_for_log(value: Any) -> str:
     if value is None:
         return "None"
     text = str(value)
-    # Remove all control characters using regex (more efficient)
-    from re import sub
-
-    sanitized = sub(r"[\x00-\x1F\x7F-\x9F]", "", text)
+    # Remove all control characters in a single str.translate pass
+    sanitized = text.translate(CONTROL_CHARS_TABLE)
     # Limit length to prevent log flooding
     return (
         sanitized[:MAX_LOG_MESSAGE_LENGTH] + "..."
@@ -188,103 +283,184 @@ def sanitize_for_log(value: Any) -> str:
 
 
 def handler(event: Dict[str, Any], context: Any) -> Dict[str, int]:
+    # Validate S3 event structure
+    records: Optional[List[Dict[str, Any]]] = event.get("Records")
+    if not records:
+        logger.error("No Records found in event")
+        return {"statusCode": 400}
+
+    # Successfully processed objects, grouped by bucket for one batched cleanup
+    processed_objects: Dict[str, List[Dict[str, str]]] = {}
+    status_code: int = 200
+    for record in records:
+        record_status = process_record(record, processed_objects)
+        if status_code == 200:
+            status_code = record_status  # Report the first failure
+
+    # Clean up S3
+    delete_processed_objects(processed_objects)
+
+    return {"statusCode": status_code}
+
+
+def process_record(
+    record: Dict[str, Any], processed_objects: Dict[str, List[Dict[str, str]]]
+) -> int:
+    """Process one S3 event record and return its HTTP-style status code."""
     key: str = "unknown"  # Default for error logging
     try:
-        # Validate S3 event structure
-        if not event.get("Records") or not event["Records"]:
-            logger.error("No Records found in event")
-            return {"statusCode": 400}
-
-        record: Dict[str, Any] = event["Records"][0]
         if (
             "s3" not in record
             or "bucket" not in record["s3"]
             or "object" not in record["s3"]
         ):
             logger.error("Invalid S3 event structure")
-            return {"statusCode": 400}
+            return 400
 
         # Get S3 object details from S3 event
         bucket: str = record["s3"]["bucket"]["name"]
         key = record["s3"]["object"]["key"]
+        size: Optional[int] = record["s3"]["object"].get("size")
 
         # Get email content from S3
         try:
-            response: Any = s3.get_object(Bucket=bucket, Key=key)
-            email_content: str = response["Body"].read().decode("utf-8")
+            email_content = read_s3_object(bucket, key, size)
         except Exception as e:
             error_code: str = (
                 getattr(e, "response", {}).get("Error", {}).get("Code", "Unknown")
             )
             if error_code == "NoSuchKey":
-                logger.error(f"S3 object not found: {sanitize_for_log(key)}")
+                logger.error("S3 object not found: %s", sanitize_for_log(key))
             elif error_code == "AccessDenied":
-                logger.error(f"Access denied to S3 object: {sanitize_for_log(key)}")
+                logger.error("Access denied to S3 object: %s", sanitize_for_log(key))
             else:
-                logger.error(f"S3 get_object failed: {sanitize_for_log(str(e))}")
-            return {"statusCode": 500}
+                logger.error("S3 get_object failed: %s", sanitize_for_log(str(e)))
+            return 500
 
         # Parse email
         try:
             meeting_details: Dict[str, str] = parse_email(email_content)
         except ValueError as e:
-            logger.error(f"Email parsing failed: {sanitize_for_log(str(e))}")
-            return {"statusCode": 422}  # Unprocessable Entity
+            logger.error("Email parsing failed: %s", sanitize_for_log(str(e)))
+            return 422  # Unprocessable Entity
 
         # Send reply
         send_reply(meeting_details, ses)
 
-        # Clean up S3
-        try:
-            s3.delete_object(Bucket=bucket, Key=key)
-        except Exception as e:
-            logger.warning(
-                f"Failed to delete S3 object {sanitize_for_log(key)}: {sanitize_for_log(str(e))}"
-            )
-            # Continue execution - cleanup failure shouldn't stop the process
-
-        return {"statusCode": 200}
+        # Queue for batched S3 cleanup
+        processed_objects.setdefault(bucket, []).append({"Key": key})
+        return 200
 
     except Exception as e:
         logger.error(
-            f"Error processing S3 object {sanitize_for_log(key)}: {sanitize_for_log(str(e))}"
+            "Error processing S3 object %s: %s",
+            sanitize_for_log(key),
+            sanitize_for_log(str(e)),
         )
-        return {"statusCode": 500}
+        return 500
+
+
+def read_s3_object(bucket: str, key: str, size: Optional[int]) -> bytes:
+    """Read an S3 object, splitting large objects into parallel ranged GETs."""
+    if size is None or size <= RANGED_GET_THRESHOLD:
+        response: Any = s3.get_object(Bucket=bucket, Key=key)
+        content: bytes = response["Body"].read()
+        return content
 
+    object_size: int = size
+    part_size = -(-object_size // RANGED_GET_PARTS)  # ceiling division
 
-def decode_html_content(content: str) -> Optional[str]:
-    from quopri import decodestring
+    def read_range(start: int) -> bytes:
+        end = min(start + part_size, object_size) - 1
+        part: Any = s3.get_object(Bucket=bucket, Key=key, Range=f"bytes={start}-{end}")
+        part_content: bytes = part["Body"].read()
+        return part_content
 
-    html_match: Optional[Match[str]] = BASE64_HTML_REGEX.search(content)
+    # Any failed range re-raises here with its botocore error intact
+    with ThreadPoolExecutor(max_workers=RANGED_GET_PARTS) as executor:
+        return b"".join(executor.map(read_range, range(0, object_size, part_size)))
+
+
+def delete_processed_objects(
+    processed_objects: Dict[str, List[Dict[str, str]]],
+) -> None:
+    """Delete processed emails with one delete_objects request per bucket."""
+    for bucket, objects in processed_objects.items():
+        # delete_objects accepts at most MAX_DELETE_BATCH_SIZE keys per request
+        for start in range(0, len(objects), MAX_DELETE_BATCH_SIZE):
+            batch = objects[start : start + MAX_DELETE_BATCH_SIZE]
+            try:
+                response: Any = s3.delete_objects(
+                    Bucket=bucket, Delete={"Objects": batch, "Quiet": True}
+                )
+            except Exception as e:
+                logger.warning(
+                    "Failed to delete %s S3 objects from %s: %s",
+                    len(batch),
+                    sanitize_for_log(bucket),
+                    sanitize_for_log(str(e)),
+                )
+                # Continue execution - cleanup failure shouldn't stop the process
+                continue
+            for error in response.get("Errors", []):
+                logger.warning(
+                    "Failed to delete S3 object %s: %s",
+                    sanitize_for_log(error.get("Key")),
+                    sanitize_for_log(error.get("Message")),
+                )
+
+
+def decode_base64_text(base64_content: bytes) -> str:
+    """Decode a line-wrapped base64 MIME body into UTF-8 text."""
+    decoded: bytes = b64decode(base64_content.translate(None, LINE_BREAK_BYTES))
+    return decoded.decode("utf-8")
+
+
+def decode_html_content(content: bytes) -> Optional[str]:
+    # Locate the HTML part with a plain substring search so the regex does not
+    # re-scan the headers and text/plain part that precede it
+    html_start = content.find(HTML_PART_HEADER)
+    if html_start == -1:
+        logger.warning("No HTML content found - no text/html part")
+        return None
+
+    # Only run the base64 pattern when a base64 part follows the HTML header
+    html_match: Optional[Match[bytes]] = None
+    if content.find(BASE64_ENCODING_HEADER, html_start) != -1:
+        html_match = BASE64_HTML_REGEX.search(content, html_start)
     if html_match:
-        base64_content: str = html_match.group(1).replace("\n", "").replace("\r", "")
-        logger.debug(f"Base64 HTML content found: {len(base64_content)} characters")
+        base64_content: bytes = html_match.group(1)
+        logger.debug("Base64 HTML content found: %s bytes", len(base64_content))
         try:
-            return b64decode(base64_content).decode("utf-8")
+            return decode_base64_text(base64_content)
         except Exception as e:
-            logger.error(f"Error decoding base64: {e}")
+            logger.error("Error decoding base64: %s", e)
             return None
 
-    html_match = QUOTED_HTML_REGEX.search(content)
-    if html_match:
-        html_content: str = html_match.group(1)
+    html_match = QUOTED_HTML_REGEX.search(content, html_start)
+    if not html_match:
+        logger.warning("No HTML content found - both regexes failed")
+        return None
+
+    html_content: bytes = html_match.group(1)
+    if logger.isEnabledFor(DEBUG):
         logger.debug(
-            f"Quoted-printable HTML content found: {sanitize_for_log(html_content[:HTML_PREVIEW_LENGTH])}"
+            "Quoted-printable HTML content found: %s",
+            sanitize_for_log(
+                html_content[:HTML_PREVIEW_LENGTH].decode("ascii", errors="replace")
+            ),
         )
+    try:
+        return decodestring(html_content).decode("utf-8")
+    except UnicodeDecodeError:
         try:
-            return decodestring(html_content).decode("utf-8")
-        except UnicodeDecodeError:
-            try:
-                return decodestring(html_content).decode("latin-1")
-            except Exception as e:
-                logger.error(f"Error decoding quoted-printable with latin-1: {e}")
-                return None
+            return decodestring(html_content).decode("latin-1")
         except Exception as e:
-            logger.error(f"Error decoding quoted-printable with utf-8: {e}")
+            logger.error("Error decoding quoted-printable with latin-1: %s", e)
             return None
-
-    logger.warning("No HTML content found - both regexes failed")
-    return None
+    except Exception as e:
+        logger.error("Error decoding quoted-printable with utf-8: %s", e)
+        return None
 
 
 def _safe_regex_extract(
@@ -324,11 +500,12 @@ def extract_meeting_details(decoded_html: str) -> Dict[str, str]:
         year: str
         time: str
         day, month_heb, year, time = groups
-        logger.debug(f"Date match: {sanitize_for_log(match.groups())}")
+        logger.debug("Date match: %s", sanitize_for_log(match.groups()))
         month: Optional[str] = HEBREW_MONTHS.get(month_heb)
         if month is None:
             logger.warning(
-                f"Unknown Hebrew month '{sanitize_for_log(month_heb)}', defaulting to January"
+                "Unknown Hebrew month '%s', defaulting to January",
+                sanitize_for_log(month_heb),
             )
             month = "01"  # January fallback
         return {"date": f"{day.zfill(2)}/{month}/{year}", "time": time}
@@ -345,29 +522,29 @@ def extract_meeting_details(decoded_html: str) -> Dict[str, str]:
     )
     if client:
         details["client"] = client  # Already cleaned by clean_html_tags
-        logger.debug(f"Client found: {sanitize_for_log(client)}")
+        logger.debug("Client found: %s", sanitize_for_log(client))
 
     # Extract phone from forwarded content only
     phone: Optional[Any] = _safe_regex_extract(PHONE_REGEX, forwarded_content, "phone")
     if phone:
         details["phone"] = phone  # Already cleaned by clean_html_tags
-        logger.debug(f"Phone found: {sanitize_for_log(phone)}")
+        logger.debug("Phone found: %s", sanitize_for_log(phone))
 
     # Extract client email from forwarded content only
     email = _safe_regex_extract(EMAIL_REGEX, forwarded_content, "email")
     if email:
         details["email"] = email  # Already cleaned by clean_html_tags
-        logger.debug(f"Client email found: {sanitize_for_log(email)}")
+        logger.debug("Client email found: %s", sanitize_for_log(email))
 
     return details
 
 
-def extract_forwarder_email(content: str) -> str:
+def extract_forwarder_email(content: bytes) -> str:
     """Extract forwarder email from headers section only."""
     # RFC 5322: headers are separated from body by a blank line
-    headers_end = content.find("\n\n")
+    headers_end = content.find(b"\n\n")
     if headers_end == -1:
-        headers_end = content.find("\r\n\r\n")
+        headers_end = content.find(b"\r\n\r\n")
 
     if headers_end == -1:
         # Non-RFC compliant email - this should not happen
@@ -376,80 +553,61 @@ def extract_forwarder_email(content: str) -> str:
         )
 
     headers_only = content[:headers_end]
-    from_match = search(r"^From:\s*(.+?)$", headers_only, MULTILINE)
+    from_match = FROM_HEADER_REGEX.search(headers_only)
 
     if not from_match:
         raise ValueError("No From address found in email headers")
-    return from_match.group(1).strip()
+    return from_match.group(1).decode("utf-8", errors="replace").strip()
 
 
-def find_forwarding_marker(content: str) -> Optional[Tuple[int, str]]:
-    """Find forwarding marker position and type in email content."""
+def find_forwarding_marker(decoded_content: str) -> Optional[Tuple[int, str]]:
+    """Find forwarding marker position and type in already-decoded email content."""
     logger.debug("Searching for forwarding marker in email content")
 
-    # First try to decode any base64 content
-    decoded_content = content
-    if "Content-Transfer-Encoding: base64" in content:
-        try:
-            # Find base64 content after the header
-            base64_match = search(
-                r"Content-Transfer-Encoding: base64\r?\n\r?\n([^-]+)",
-                content,
-                DOTALL,
-            )
-            if base64_match:
-                base64_content = (
-                    base64_match.group(1).replace("\n", "").replace("\r", "")
-                )
-                decoded_content = b64decode(base64_content).decode("utf-8")
-                logger.debug(f"Decoded base64 content, length: {len(decoded_content)}")
-        except Exception as e:
-            logger.debug(f"Failed to decode base64: {e}")
-
     # Find forwarded message marker from various email clients in decoded content
-    for marker in FORWARDING_MARKERS:
+    marker_match = CLIENT_FORWARDING_MARKER_REGEX.search(decoded_content)
+    if marker_match:
+        pos, marker = marker_match.start(), marker_match.group(0)
+    else:
+        marker = FALLBACK_FORWARDING_MARKER
         pos = decoded_content.find(marker)
-        if pos != -1:
-            logger.info(f"Found marker '{marker}' at position {pos}")
-            return pos, marker
+    if pos != -1:
+        logger.debug("Found marker '%s' at position %s", marker, pos)
+        return pos, marker
 
-    logger.info("No forwarding marker found")
+    logger.debug("No forwarding marker found")
     return None
 
 
-def decode_base64_content(content: str) -> str:
+def decode_base64_content(content: bytes) -> str:
     """Decode base64 content if present in email."""
     logger.debug("Checking for base64 content")
 
-    if "Content-Transfer-Encoding: base64" in content:
+    if BASE64_ENCODING_HEADER in content:
         try:
             # Find base64 content after the header
-            base64_match = search(
-                r"Content-Transfer-Encoding: base64\r?\n\r?\n([^-]+)",
-                content,
-                DOTALL,
-            )
+            base64_match = BASE64_CONTENT_REGEX.search(content)
             if base64_match:
-                base64_content = (
-                    base64_match.group(1).replace("\n", "").replace("\r", "")
-                )
-                decoded_content = b64decode(base64_content).decode("utf-8")
-                logger.debug(f"Decoded base64 content, length: {len(decoded_content)}")
+                decoded_content = decode_base64_text(base64_match.group(1))
+                logger.debug("Decoded base64 content, length: %s", len(decoded_content))
                 return decoded_content
         except Exception as e:
-            logger.debug(f"Failed to decode base64: {e}")
+            logger.debug("Failed to decode base64: %s", e)
 
-    # Return original content if no base64 found
-    return content
+    # Return original content as text if no base64 found; a stray non-UTF-8
+    # byte in the raw message must not fail the whole parse
+    return content.decode("utf-8", errors="replace")
 
 
 def extract_pre_forwarded_content(content: str, marker_pos: int) -> str:
     """Extract content before the forwarding marker."""
     pre_forwarded_content = content[:marker_pos].strip()
-    logger.debug(f"Pre-forwarded content length: {len(pre_forwarded_content)}")
-    logger.debug(
-        f"Pre-forwarded content preview: {sanitize_for_log(pre_forwarded_content[:100])}"
-    )
+    logger.debug("Pre-forwarded content length: %s", len(pre_forwarded_content))
+    if logger.isEnabledFor(DEBUG):
+        logger.debug(
+            "Pre-forwarded content preview: %s",
+            sanitize_for_log(pre_forwarded_content[:100]),
+        )
     return pre_forwarded_content
 
 
@@ -461,16 +619,15 @@ def parse_attendee_from_content(content: str) -> Optional[Dict[str, str]]:
         logger.info("No pre-forwarded content found")
         return None
 
-    # Split into lines and process
-    lines = [line.strip() for line in content.split("\n") if line.strip()]
-    logger.debug(f"Processing {len(lines)} lines for attendee info")
-
     # Track what we've found
     found_name = False
     attendee = {}
+    # Per-line debug arguments are only sanitized when DEBUG is enabled
+    debug_enabled = logger.isEnabledFor(DEBUG)
 
-    # Process each line
-    for line in lines:
+    # Process each line lazily, without materializing a list of all lines
+    for raw_line in content.splitlines():
+        line = raw_line.strip()
         # Skip empty or very short lines
         if len(line) < 2:
             continue
@@ -478,15 +635,17 @@ def parse_attendee_from_content(content: str) -> Optional[Dict[str, str]]:
         # Check for Hebrew prefix first
         if line.startswith("הוסף "):
             line_content = line[5:].strip()  # Remove "הוסף "
-            logger.debug(
-                f"Found Hebrew prefix, content: {sanitize_for_log(line_content)}"
-            )
+            if debug_enabled:
+                logger.debug(
+                    "Found Hebrew prefix, content: %s", sanitize_for_log(line_content)
+                )
         # Check for English prefix (case-insensitive)
         elif line.upper().startswith("ADD "):
             line_content = line[4:].strip()  # Remove "ADD " (any case)
-            logger.debug(
-                f"Found English prefix, content: {sanitize_for_log(line_content)}"
-            )
+            if debug_enabled:
+                logger.debug(
+                    "Found English prefix, content: %s", sanitize_for_log(line_content)
+                )
         else:
             # Skip lines without ADD/הוסף prefix
             continue
@@ -496,37 +655,43 @@ def parse_attendee_from_content(content: str) -> Optional[Dict[str, str]]:
             # First name - create attendee
             attendee["name"] = line_content
             found_name = True
-            logger.debug(f"Found first name: {sanitize_for_log(line_content)}")
+            if debug_enabled:
+                logger.debug("Found first name: %s", sanitize_for_log(line_content))
         else:
             # Already have name - only add phone/email if not already set
             phone = parse_phone_number(line_content)
             if "phone" not in attendee and phone:
                 attendee["phone"] = phone
-                logger.debug(f"Added phone: {sanitize_for_log(attendee['phone'])}")
+                if debug_enabled:
+                    logger.debug("Added phone: %s", sanitize_for_log(attendee["phone"]))
             elif "email" not in attendee and is_email(line_content):
                 attendee["email"] = line_content
-                logger.debug(f"Added email: {sanitize_for_log(line_content)}")
-            else:
+                if debug_enabled:
+                    logger.debug("Added email: %s", sanitize_for_log(line_content))
+            elif debug_enabled:
                 logger.debug(
-                    f"Ignoring line (duplicate or invalid): {sanitize_for_log(line_content)}"
+                    "Ignoring line (duplicate or invalid): %s",
+                    sanitize_for_log(line_content),
                 )
 
+            # Every field is set - any further ADD lines would be ignored anyway
+            if "phone" in attendee and "email" in attendee:
+                break
+
     # Must have at least a name
     if not found_name:
         logger.debug("No valid name found with ADD/הוסף prefix")
         return None
 
     logger.info(
-        f"Additional attendee parsed successfully: {sanitize_for_log(attendee)}"
+        "Additional attendee parsed successfully: %s", sanitize_for_log(attendee)
     )
     return attendee
 
 
 def parse_phone_number(content: str) -> Optional[str]:
     """Parse phone number from content. Returns None if invalid."""
-    # Support both Israeli 05x and international +972-5x formats
-    phone_pattern = compile(r"(05[0-9]|\+972-5[0-9])-?[0-9]{7}")
-    phone_match = phone_pattern.search(content)
+    phone_match = ATTENDEE_PHONE_REGEX.search(content)
     if not phone_match:
         return None
 
@@ -539,52 +704,53 @@ def parse_phone_number(content: str) -> Optional[str]:
 
 def is_email(content: str) -> bool:
     """Check if content is a valid email address."""
+    # Cheap prefilter before the regex: most ADD lines are names or phones
+    if "@" not in content:
+        return False
     # Simple regex validation: basic email format check
-    return bool(search(r"^[^@\s]+@[^@\s]+\.[^@\s]+$", content))
+    return bool(ATTENDEE_EMAIL_REGEX.search(content))
 
 
-def parse_additional_attendee(content: str) -> Optional[Dict[str, str]]:
+def parse_additional_attendee(content: bytes) -> Optional[Dict[str, str]]:
     """Parse additional attendee info from content, with or without forwarding marker."""
     logger.debug("Starting additional attendee parsing")
 
+    # Decode base64 content once; marker search and fallback both reuse it
+    decoded_content = decode_base64_content(content)
+
     # First try to find forwarding marker
-    marker_result = find_forwarding_marker(content)
+    marker_result = find_forwarding_marker(decoded_content)
+    remaining_content = decoded_content
 
     if marker_result:
         # Use the original logic when marker is present
         marker_pos, used_marker = marker_result
         logger.debug(
-            f"Found forwarding marker '{used_marker}' at position {marker_pos}"
+            "Found forwarding marker '%s' at position %s", used_marker, marker_pos
         )
 
-        # The marker position is in the decoded content, so we need to decode first
-        decoded_content = decode_base64_content(content)
-
-        # Find the marker in the decoded content
-        marker_pos_in_decoded = decoded_content.find(used_marker)
-        if marker_pos_in_decoded == -1:
-            logger.debug("Marker not found in decoded content")
-            return None
-
         # Extract pre-forwarded content from decoded content
-        pre_forwarded_content = decoded_content[:marker_pos_in_decoded].strip()
-        logger.debug(f"Pre-forwarded content length: {len(pre_forwarded_content)}")
+        pre_forwarded_content = extract_pre_forwarded_content(
+            decoded_content, marker_pos
+        )
 
         # Parse attendee from decoded content
         result = parse_attendee_from_content(pre_forwarded_content)
         if result:
             return result
 
-    # Fallback: if no forwarding marker or parsing failed, try parsing entire content
-    logger.debug("No forwarding marker found or parsing failed, trying entire content")
+        # The pre-forwarded lines hold no ADD prefix, so only the rest is unscanned
+        remaining_content = decoded_content[marker_pos + len(used_marker) :]
 
-    # Decode base64 content if present
-    decoded_content = decode_base64_content(content)
+    # Fallback: if no forwarding marker or parsing failed, try parsing remaining content
+    logger.debug(
+        "No forwarding marker found or parsing failed, trying remaining content"
+    )
 
-    # Try to parse ADD lines from the entire decoded content
-    result = parse_attendee_from_content(decoded_content)
+    # Try to parse ADD lines from the not-yet-scanned decoded content
+    result = parse_attendee_from_content(remaining_content)
     if result:
-        logger.debug("Successfully parsed additional attendee from entire content")
+        logger.debug("Successfully parsed additional attendee from remaining content")
         return result
 
     logger.debug("No additional attendee found in any content")
@@ -593,26 +759,31 @@ def parse_additional_attendee(content: str) -> Optional[Dict[str, str]]:
 
 def extract_forwarded_content(decoded_html: str) -> str:
     """Extract content after forwarded message marker."""
-    for marker in FORWARDING_MARKERS:
-        marker_pos = decoded_html.find(marker)
-        if marker_pos != -1:
-            return decoded_html[marker_pos + len(marker) :]
+    marker_result = find_forwarding_marker(decoded_html)
+    if marker_result:
+        marker_pos, marker = marker_result
+        return decoded_html[marker_pos + len(marker) :]
 
     # Fallback: use entire content if no marker found
     return decoded_html
 
 
-def parse_email(content: str) -> Dict[str, str]:
-    logger.debug(
-        f"Email content preview: {sanitize_for_log(content[:EMAIL_PREVIEW_LENGTH])}"
-    )
+def parse_email(content: bytes) -> Dict[str, str]:
+    # Previews are only sliced, decoded and sanitized when DEBUG is enabled
+    if logger.isEnabledFor(DEBUG):
+        logger.debug(
+            "Email content preview: %s",
+            sanitize_for_log(
+                content[:EMAIL_PREVIEW_LENGTH].decode("utf-8", errors="replace")
+            ),
+        )
 
     # Extract From address from headers only
     from_address = extract_forwarder_email(content)
-    logger.debug(f"From address: {sanitize_for_log(from_address)}")
+    logger.debug("From address: %s", sanitize_for_log(from_address))
 
-    # Check if this is from a supported domain
-    if not any(domain in content for domain in SUPPORTED_DOMAINS):
+    # Check if this is from a supported domain (single scan for all domains)
+    if not SUPPORTED_DOMAIN_REGEX.search(content):
         raise ValueError(
             f"Email not from supported domain. Supported: {SUPPORTED_DOMAINS}"
         )
@@ -625,9 +796,11 @@ def parse_email(content: str) -> Dict[str, str]:
     if not decoded_html:
         raise ValueError("Failed to decode HTML content from email")
 
-    logger.debug(
-        f"Decoded HTML: {sanitize_for_log(decoded_html[:DECODED_HTML_PREVIEW_LENGTH])}"
-    )
+    if logger.isEnabledFor(DEBUG):
+        logger.debug(
+            "Decoded HTML: %s",
+            sanitize_for_log(decoded_html[:DECODED_HTML_PREVIEW_LENGTH]),
+        )
 
     # Parse additional attendee from raw email content (before HTML decoding)
     additional_attendee: Optional[Dict[str, str]] = parse_additional_attendee(content)
@@ -635,15 +808,17 @@ def parse_email(content: str) -> Dict[str, str]:
         details["additional_name"] = additional_attendee.get("name", "")
         details["additional_email"] = additional_attendee.get("email", "")
         details["additional_phone"] = additional_attendee.get("phone", "")
-        logger.debug(
-            f"Additional attendee found: {sanitize_for_log(additional_attendee)}"
-        )
+        if logger.isEnabledFor(DEBUG):
+            logger.debug(
+                "Additional attendee found: %s", sanitize_for_log(additional_attendee)
+            )
 
     # Extract meeting details
     meeting_data = extract_meeting_details(decoded_html)
     details.update(meeting_data)
 
-    logger.debug(f"Final details: {sanitize_for_log(details)}")
+    if logger.isEnabledFor(DEBUG):
+        logger.debug("Final details: %s", sanitize_for_log(details))
     if len(details) < MIN_MEETING_FIELDS:
         raise ValueError(
             f"Insufficient meeting details found. Got {len(details)}, need {MIN_MEETING_FIELDS}"
@@ -651,16 +826,15 @@ def parse_email(content: str) -> Dict[str, str]:
     return details
 
 
+# Warm containers see the same few consultants' From headers over and over
+@lru_cache(maxsize=128)
 def extract_email_address(from_field: str) -> str:
     """Extract clean email address from 'Name <email>' format."""
-    if "<" in from_field and ">" in from_field:
-        try:
-            return from_field.split("<")[1].split(">")[0]
-        except IndexError as e:
-            raise ValueError(f"Malformed email address format: {from_field}") from e
-    return from_field
+    address_match = ANGLE_ADDRESS_REGEX.search(from_field)
+    return address_match.group(1) if address_match else from_field
 
 
+@lru_cache(maxsize=128)
 def extract_consultant_name(from_field: str) -> str:
     """Extract consultant name from 'Name <email>' format."""
     if "<" in from_field and ">" in from_field:
@@ -671,67 +845,78 @@ def extract_consultant_name(from_field: str) -> str:
     return from_field.strip()
 
 
-def generate_whatsapp_text(details: Dict[str, str]) -> str:
-    """Generate WhatsApp message text."""
+def parse_meeting_date(date: str) -> Optional[datetime]:
+    """Parse the extracted dd/mm/yyyy meeting date into a datetime."""
+    date_parts = date.split("/")
+    if len(date_parts) != 3:  # day, month, year
+        return None
+    day, month, year = date_parts
+    try:
+        return datetime(int(year), int(month), int(day))
+    except (ValueError, TypeError) as e:
+        logger.error(
+            "Error parsing date %s/%s/%s: %s",
+            sanitize_for_log(day),
+            sanitize_for_log(month),
+            sanitize_for_log(year),
+            sanitize_for_log(e),
+        )
+        return None
+
+
+def generate_quoted_whatsapp_text(
+    details: Dict[str, str], meeting_date: Optional[datetime]
+) -> str:
+    """Generate the percent-encoded WhatsApp message text for link URLs."""
     # Calculate day of week
-    day_name = ""
-    date_parts = details.get("date", "").split("/")
-    if len(date_parts) == 3:  # day, month, year
-        day, month, year = date_parts
-        try:
-            date_obj = datetime(int(year), int(month), int(day))
-            day_name = HEBREW_DAYS[date_obj.weekday()]
-        except (ValueError, TypeError, IndexError) as e:
-            logger.error(
-                f"Error parsing date {sanitize_for_log(day)}/{sanitize_for_log(month)}/{sanitize_for_log(year)}: {sanitize_for_log(e)}"
-            )
+    day_name = HEBREW_DAYS[meeting_date.weekday()] if meeting_date else ""
 
     # Extract consultant name from From field
     consultant_name = extract_consultant_name(details.get("from", ""))
 
-    # Choose template based on whether there's an additional attendee (regardless of phone duplicates)
-    additional_name_value = details.get("additional_name", "")
-    has_additional_attendee = (
-        "additional_name" in details
-        and additional_name_value
-        and additional_name_value.strip()
-    )
+    client_name = details.get("client", "")
+    additional_name = details.get("additional_name", "")
 
-    if has_additional_attendee:
+    # Choose template based on whether there's an additional attendee (regardless of phone duplicates)
+    if additional_name.strip():
         # Build combined name for couple template
-        client_name = details.get("client", "")
-        additional_name = details.get("additional_name", "")
         combined_client = f"{client_name} ו{additional_name}"
         template = WHATSAPP_MESSAGE_TEMPLATE
-        logger.debug(f"Using couple template for: {sanitize_for_log(combined_client)}")
+        logger.debug("Using couple template for: %s", sanitize_for_log(combined_client))
     else:
-        combined_client = details.get("client", "")
+        combined_client = client_name
         template = WHATSAPP_MESSAGE_TEMPLATE_SINGLE
-        logger.debug(f"Using single template for: {sanitize_for_log(combined_client)}")
-
-    return template.format(
-        client=combined_client,
-        day_name=day_name,
-        date=details.get("date", "").replace("/", "."),
-        time=details.get("time", ""),
-        consultant_name=consultant_name,
+        logger.debug("Using single template for: %s", sanitize_for_log(combined_client))
+
+    fields = {
+        "client": combined_client,
+        "day_name": day_name,
+        "date": details.get("date", "").translate(DATE_SEPARATORS_TABLE),
+        "time": details.get("time", ""),
+        "consultant_name": consultant_name,
+    }
+    return "".join(
+        literal if field is None else literal + quote(fields[field])
+        for literal, field in QUOTED_WHATSAPP_TEMPLATES[template]
     )
 
 
-def generate_whatsapp_links(details: Dict[str, str], whatsapp_text: str) -> List[str]:
+def generate_whatsapp_links(
+    details: Dict[str, str], quoted_whatsapp_text: str
+) -> List[str]:
     """Generate WhatsApp links for all recipients with phone numbers."""
     links = []
 
     # Main client phone
-    main_phone = details.get("phone", "").replace("-", "").replace(" ", "")
+    main_phone = details.get("phone", "").translate(PHONE_SEPARATORS_TABLE)
     if main_phone and main_phone.isdigit() and len(main_phone) >= 9:
         if main_phone.startswith("0"):
             main_phone = "972" + main_phone[1:]  # Convert Israeli 0xx to +972xx
-        links.append(f"https://wa.me/{main_phone}?text={quote(whatsapp_text)}")
+        links.append(f"https://wa.me/{main_phone}?text={quoted_whatsapp_text}")
 
     # Additional attendee phone
-    additional_phone = (
-        details.get("additional_phone", "").replace("-", "").replace(" ", "")
+    additional_phone = details.get("additional_phone", "").translate(
+        PHONE_SEPARATORS_TABLE
     )
     if additional_phone and additional_phone.isdigit() and len(additional_phone) >= 9:
         if additional_phone.startswith("0"):
@@ -741,36 +926,41 @@ def generate_whatsapp_links(details: Dict[str, str], whatsapp_text: str) -> List
         # Only add if different from main phone
         if additional_phone != main_phone:
             links.append(
-                f"https://wa.me/{additional_phone}?text={quote(whatsapp_text)}"
+                f"https://wa.me/{additional_phone}?text={quoted_whatsapp_text}"
             )
 
     return links
 
 
+def format_calendar_timestamp(moment: datetime) -> str:
+    """Format a datetime as a Google Calendar YYYYMMDDTHHMMSS timestamp."""
+    return (
+        f"{moment.year:04d}{moment.month:02d}{moment.day:02d}"
+        f"T{moment.hour:02d}{moment.minute:02d}{moment.second:02d}"
+    )
+
+
 def generate_calendar_link(
-    details: Dict[str, str], email_address: str, whatsapp_text: str
+    details: Dict[str, str],
+    email_address: str,
+    quoted_whatsapp_text: str,
+    meeting_date: Optional[datetime],
 ) -> str:
     """Generate Google Calendar link for the meeting."""
-    date_parts = details.get("date", "").split("/")
     time_parts = details.get("time", "").split(":")
 
-    if len(date_parts) != 3 or len(time_parts) != 2:  # day/month/year and hour:minute
+    if meeting_date is None or len(time_parts) != 2:  # date and hour:minute
         return "#invalid-date"
 
-    day, month, year = date_parts
     hour, minute = time_parts
 
     try:
-        from datetime import timedelta
-
-        start_dt = datetime(int(year), int(month), int(day), int(hour), int(minute))
+        start_dt = meeting_date.replace(hour=int(hour), minute=int(minute))
         end_dt = start_dt + timedelta(hours=1)  # Default 1-hour meeting
-        start_time = start_dt.strftime("%Y%m%dT%H%M%S")
-        end_time = end_dt.strftime("%Y%m%dT%H%M%S")
+        start_time = format_calendar_timestamp(start_dt)
+        end_time = format_calendar_timestamp(end_dt)
     except ValueError:
-        logger.error(
-            f"Invalid date/time values: {sanitize_for_log(date_parts)} {sanitize_for_log(time_parts)}"
-        )
+        logger.error("Invalid time values: %s", sanitize_for_log(time_parts))
         return "#invalid-date"
 
     # Build subject with client name(s)
@@ -796,137 +986,157 @@ def generate_calendar_link(
 
     attendees = ",".join(attendees_list)
 
-    return f"https://calendar.google.com/calendar/render?action=TEMPLATE&text={quote(subject)}&dates={start_time}/{end_time}&add={attendees}&details={quote(whatsapp_text)}"
+    return f"https://calendar.google.com/calendar/render?action=TEMPLATE&text={quote(subject)}&dates={start_time}/{end_time}&add={attendees}&details={quoted_whatsapp_text}"
 
 
-def send_email_notification(
+def build_notification_message(
     email_address: str,
     whatsapp_links: List[str],
     calendar_link: str,
     details: Dict[str, str],
-    ses: Any,
-) -> None:
-    """Send email notification with meeting details and links."""
+) -> bytes:
+    """Render the notification email with meeting details and links as MIME."""
+    client_name = details.get("client", "")
+    main_phone = details.get("phone", "")
+    main_email = details.get("email", "")
+    additional_name = details.get("additional_name", "")
+    additional_phone = details.get("additional_phone", "")
+    additional_email = details.get("additional_email", "")
+    # Both bodies flag an additional attendee sharing the client's phone or email
+    main_phone_digits = main_phone.translate(PHONE_DASHES_TABLE)
+    is_duplicate_phone = (
+        additional_phone.translate(PHONE_DASHES_TABLE) == main_phone_digits
+    )
+    is_duplicate_email = additional_email == main_email
+
+    # Look up and escape each shared field once for both bodies
+    text_fields = {
+        field: sanitize_for_log(details.get(field, "")) for field in EMAIL_DETAIL_FIELDS
+    }
+    html_fields = {
+        field: escape(details.get(field, "")) for field in EMAIL_DETAIL_FIELDS
+    }
+
     # Format WhatsApp links with labels
     if len(whatsapp_links) > 1:
-        whatsapp_section = f"📱 WhatsApp {details.get('client', '')}: {whatsapp_links[0]}\n📱 WhatsApp {details.get('additional_name', '')}: {whatsapp_links[1]}"
+        whatsapp_section = f"📱 WhatsApp {client_name}: {whatsapp_links[0]}\n📱 WhatsApp {additional_name}: {whatsapp_links[1]}"
     elif whatsapp_links:
         whatsapp_section = f"📱 WhatsApp: {whatsapp_links[0]}"
     else:
         whatsapp_section = "📱 WhatsApp: לא זמין"
 
     # Build attendee info
-    attendee_info = f"👤 לקוח: {sanitize_for_log(details.get('client', ''))}"
-    if details.get("phone"):
-        attendee_info += f"\n📱 טלפון: {sanitize_for_log(details.get('phone', ''))}"
-    if details.get("email"):
-        attendee_info += f"\n📧 אימייל: {sanitize_for_log(details.get('email', ''))}"
+    attendee_lines = [f"👤 לקוח: {text_fields['client']}"]
+    if main_phone:
+        attendee_lines.append(f"📱 טלפון: {text_fields['phone']}")
+    if main_email:
+        attendee_lines.append(f"📧 אימייל: {text_fields['email']}")
 
     # Add additional attendee if present
-    additional_name = details.get("additional_name", "")
-    if additional_name and additional_name.strip():
-        attendee_info += f"\n\n👥 משתתף נוסף: {additional_name.strip()}"
+    if additional_name.strip():
+        attendee_lines.append(f"\n👥 משתתף נוסף: {additional_name.strip()}")
 
         # Check for duplicate phone
-        additional_phone = details.get("additional_phone", "")
-        main_phone = details.get("phone", "")
         if additional_phone:
-            if additional_phone.replace("-", "") == main_phone.replace("-", ""):
-                attendee_info += f"\n📱 טלפון: {additional_phone} (כפול)"
+            if is_duplicate_phone:
+                attendee_lines.append(f"📱 טלפון: {additional_phone} (כפול)")
             else:
-                attendee_info += f"\n📱 טלפון: {additional_phone}"
+                attendee_lines.append(f"📱 טלפון: {additional_phone}")
 
         # Check for duplicate email
-        additional_email = details.get("additional_email", "")
-        main_email = details.get("email", "")
         if additional_email:
-            if additional_email == main_email:
-                attendee_info += f"\n📧 אימייל: {additional_email} (כפול)"
+            if is_duplicate_email:
+                attendee_lines.append(f"📧 אימייל: {additional_email} (כפול)")
             else:
-                attendee_info += f"\n📧 אימייל: {additional_email}"
-
-    body = f"""שלום,
-
-קישורים שימושיים:
-{whatsapp_section}
-📅 הוסף ליומן: {calendar_link}
-
-אישור פגישה:
-📅 תאריך: {sanitize_for_log(details.get("date", ""))}
-🕐 שעה: {sanitize_for_log(details.get("time", ""))}
-{attendee_info}
-
-בהצלחה!"""
+                attendee_lines.append(f"📧 אימייל: {additional_email}")
+    attendee_info = "\n".join(attendee_lines)
+
+    body = TEXT_EMAIL_TEMPLATE.format_map(
+        text_fields
+        | {
+            "whatsapp_section": whatsapp_section,
+            "calendar_link": calendar_link,
+            "attendee_info": attendee_info,
+        }
+    )
 
     # Build additional attendee HTML section
-    additional_attendee_html = ""
-    additional_name = details.get("additional_name", "")
-    if additional_name and additional_name.strip():
-        additional_attendee_html = (
+    additional_attendee_parts: List[str] = []
+    if additional_name.strip():
+        additional_attendee_parts.append(
             f"<br><br>משתתף נוסף:<br>👤 לקוח: {escape(additional_name.strip())}<br>"
         )
 
         # Add phone with duplicate check
-        additional_phone = details.get("additional_phone", "")
-        main_phone = details.get("phone", "")
         if additional_phone:
-            if additional_phone.replace("-", "") == main_phone.replace("-", ""):
-                additional_attendee_html += (
+            if is_duplicate_phone:
+                additional_attendee_parts.append(
                     f"📱 טלפון: {escape(additional_phone)}(כפול)<br>"
                 )
             else:
-                additional_attendee_html += f"📱 טלפון: {escape(additional_phone)}<br>"
+                additional_attendee_parts.append(
+                    f"📱 טלפון: {escape(additional_phone)}<br>"
+                )
         else:
-            additional_attendee_html += "📱 טלפון: חסר<br>"
+            additional_attendee_parts.append("📱 טלפון: חסר<br>")
 
         # Add email with duplicate check
-        additional_email = details.get("additional_email", "")
-        main_email = details.get("email", "")
         if additional_email:
-            if additional_email == main_email:
-                additional_attendee_html += (
+            if is_duplicate_email:
+                additional_attendee_parts.append(
                     f"📧 אימייל: {escape(additional_email)}(כפול)"
                 )
             else:
-                additional_attendee_html += f"📧 אימייל: {escape(additional_email)}"
+                additional_attendee_parts.append(
+                    f"📧 אימייל: {escape(additional_email)}"
+                )
         else:
-            additional_attendee_html += "📧 אימייל: חסר"
+            additional_attendee_parts.append("📧 אימייל: חסר")
+    additional_attendee_html = "".join(additional_attendee_parts)
 
-    # Build HTML WhatsApp links section
+    # Build HTML WhatsApp links section; the hrefs are a digits-only phone plus
+    # quote()-encoded text, so they carry nothing that needs HTML escaping
     if len(whatsapp_links) > 1:
-        whatsapp_links_html = f'📱 <a href="{escape(whatsapp_links[0])}" style="color: #25D366; text-decoration: underline; font-weight: bold;">WhatsApp {escape(details.get("client", ""))}</a><br>\n📱 <a href="{escape(whatsapp_links[1])}" style="color: #25D366; text-decoration: underline; font-weight: bold;">WhatsApp {escape(details.get("additional_name", ""))}</a>'
+        whatsapp_links_html = f'📱 <a href="{whatsapp_links[0]}" style="color: #25D366; text-decoration: underline; font-weight: bold;">WhatsApp {html_fields["client"]}</a><br>\n📱 <a href="{whatsapp_links[1]}" style="color: #25D366; text-decoration: underline; font-weight: bold;">WhatsApp {escape(additional_name)}</a>'
     elif whatsapp_links:
-        whatsapp_links_html = f'📱 <a href="{escape(whatsapp_links[0])}" style="color: #25D366; text-decoration: underline; font-weight: bold;">שלח תזכורת WhatsApp</a>'
+        whatsapp_links_html = f'📱 <a href="{whatsapp_links[0]}" style="color: #25D366; text-decoration: underline; font-weight: bold;">שלח תזכורת WhatsApp</a>'
     else:
         whatsapp_links_html = "📱 WhatsApp: לא זמין"
 
-    html_body = HTML_EMAIL_TEMPLATE.format(
-        whatsapp_links_html=whatsapp_links_html,
-        calendar_link=escape(calendar_link),
-        date=escape(details.get("date", "")),
-        time=escape(details.get("time", "")),
-        client=escape(details.get("client", "")),
-        phone=escape(details.get("phone", "")),
-        email=escape(details.get("email", "")),
-        additional_attendee_html=additional_attendee_html,
+    html_body = HTML_EMAIL_TEMPLATE.format_map(
+        html_fields
+        | {
+            "whatsapp_links_html": whatsapp_links_html,
+            "calendar_link": escape(calendar_link),
+            "additional_attendee_html": additional_attendee_html,
+        }
     )
 
+    # Send prebuilt MIME (CRLF line endings) so the Hebrew bodies are not
+    # sent as percent-encoded form parameters in the SES request
+    message = EmailMessage(policy=SMTP)
+    message["Subject"] = "אישור פגישה"
+    message["From"] = EMAIL_SOURCE
+    message["To"] = email_address
+    message.set_content(body)
+    message.add_alternative(html_body, subtype="html")
+    return message.as_bytes()
+
+
+def send_email_notification(email_address: str, raw_message: bytes, ses: Any) -> None:
+    """Send a rendered notification email through SES."""
     try:
-        ses.send_email(
+        ses.send_raw_email(
             Source=EMAIL_SOURCE,
-            Destination={"ToAddresses": [email_address]},
-            Message={
-                "Subject": {"Data": "אישור פגישה", "Charset": "UTF-8"},
-                "Body": {
-                    "Text": {"Data": body, "Charset": "UTF-8"},
-                    "Html": {"Data": html_body, "Charset": "UTF-8"},
-                },
-            },
+            Destinations=[email_address],
+            RawMessage={"Data": raw_message},
         )
-        logger.info(f"Email sent successfully to {sanitize_for_log(email_address)}")
+        logger.info("Email sent successfully to %s", sanitize_for_log(email_address))
     except Exception as e:
         logger.error(
-            f"Failed to send email to {sanitize_for_log(email_address)}: {sanitize_for_log(str(e))}"
+            "Failed to send email to %s: %s",
+            sanitize_for_log(email_address),
+            sanitize_for_log(str(e)),
         )
         raise
 
@@ -936,7 +1146,15 @@ def send_reply(details: Dict[str, str], ses: Any) -> None:
     if "from" not in details:
         raise ValueError("Missing required 'from' field in meeting details")
     email_address = extract_email_address(details["from"])
-    whatsapp_text = generate_whatsapp_text(details)
-    whatsapp_links = generate_whatsapp_links(details, whatsapp_text)
-    calendar_link = generate_calendar_link(details, email_address, whatsapp_text)
-    send_email_notification(email_address, whatsapp_links, calendar_link, details, ses)
+    # Parse the date once; the WhatsApp text and calendar link both consume it
+    meeting_date = parse_meeting_date(details.get("date", ""))
+    # Percent-encoded once for every link that embeds it
+    quoted_whatsapp_text = generate_quoted_whatsapp_text(details, meeting_date)
+    whatsapp_links = generate_whatsapp_links(details, quoted_whatsapp_text)
+    calendar_link = generate_calendar_link(
+        details, email_address, quoted_whatsapp_text, meeting_date
+    )
+    raw_message = build_notification_message(
+        email_address, whatsapp_links, calendar_link, details
+    )
+    send_email_notification(email_address, raw_message, ses)